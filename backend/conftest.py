@@ -0,0 +1,12 @@
+import logging
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def silence_logging():
+    # The views log every request; emitting those records only adds noise
+    # and overhead to the test run.
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
@@ -8,7 +8,12 @@ env = environ.Env(
     DEBUG=(bool, True)
 )
 
-environ.Env.read_env(BASE_DIR / '.env')
+ENV_FILE = BASE_DIR / '.env'
+
+# Containers get their configuration from the environment, so only touch
+# the filesystem when a .env file is actually present.
+if ENV_FILE.is_file():
+    environ.Env.read_env(ENV_FILE)
 
 # SECURITY WARNING: keep the secret key used in production secret I know just kept it for simplicity
 SECRET_KEY = env(
@@ -20,12 +25,20 @@ DEBUG = env('DEBUG')
 ALLOWED_HOSTS = env.list('ALLOWED_HOSTS', default=['localhost', '127.0.0.1'])
 
 
-INSTALLED_APPS = [
+# The API is anonymous JSON only; the admin and the session/auth/messages
+# stack behind it are opt-in so API-only deployments don't pay for them.
+ENABLE_ADMIN = env.bool('ENABLE_ADMIN', default=DEBUG)
+
+ADMIN_APPS = [
     "django.contrib.admin",
     "django.contrib.auth",
-    "django.contrib.contenttypes",
     "django.contrib.sessions",
     "django.contrib.messages",
+] if ENABLE_ADMIN else []
+
+INSTALLED_APPS = [
+    *ADMIN_APPS,
+    "django.contrib.contenttypes",
     "django.contrib.staticfiles",
     "rest_framework",
     "corsheaders",
@@ -36,11 +49,13 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    *(["django.contrib.sessions.middleware.SessionMiddleware"] if ENABLE_ADMIN else []),
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
+    *([
+        "django.contrib.auth.middleware.AuthenticationMiddleware",
+        "django.contrib.messages.middleware.MessageMiddleware",
+    ] if ENABLE_ADMIN else []),
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
@@ -55,8 +70,10 @@ TEMPLATES = [
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
-                "django.contrib.auth.context_processors.auth",
-                "django.contrib.messages.context_processors.messages",
+                *([
+                    "django.contrib.auth.context_processors.auth",
+                    "django.contrib.messages.context_processors.messages",
+                ] if ENABLE_ADMIN else []),
             ],
         },
     },
@@ -73,6 +90,10 @@ DATABASES = {
         'PASSWORD': env('DB_PASSWORD', default='postgres'),
         'HOST': env('DB_HOST', default='127.0.0.1'),
         'PORT': env('DB_PORT', default='5432'),
+        # Reuse connections across requests instead of reconnecting each time;
+        # set DB_CONN_MAX_AGE=0 to get per-request connections back.
+        'CONN_MAX_AGE': env.int('DB_CONN_MAX_AGE', default=60),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -98,7 +119,7 @@ LANGUAGE_CODE = "en-us"
 
 TIME_ZONE = "UTC"
 
-USE_I18N = True
+USE_I18N = False
 
 USE_TZ = True
 
@@ -108,19 +129,28 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Upper bound on request bodies; also enforced for JSON API requests by
+# data_transform.parsers.BoundedORJSONParser.
+DATA_UPLOAD_MAX_MEMORY_SIZE = env.int(
+    'DATA_UPLOAD_MAX_MEMORY_SIZE', default=8 * 1024 * 1024)
+
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.SessionAuthentication',
-    ],
+    ] if ENABLE_ADMIN else [],
+    # AnonymousUser lives in django.contrib.auth, which may not be installed
+    'UNAUTHENTICATED_USER': (
+        'django.contrib.auth.models.AnonymousUser' if ENABLE_ADMIN else None
+    ),
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'drf_orjson_renderer.renderers.ORJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'data_transform.parsers.BoundedORJSONParser',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
@@ -171,7 +201,7 @@ LOGGING = {
     'loggers': {
         'data_transform': {
             'handlers': ['console'],
-            'level': 'DEBUG',
+            'level': env('LOG_LEVEL', default='INFO'),
             'propagate': False,
         },
     },
@@ -0,0 +1,36 @@
+"""
+Request parsers for the data transformation API.
+"""
+
+import orjson
+from django.conf import settings
+from drf_orjson_renderer.parsers import ORJSONParser
+from rest_framework import status
+from rest_framework.exceptions import APIException, ParseError
+
+
+class PayloadTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = 'Request body exceeds the maximum allowed size.'
+    default_code = 'payload_too_large'
+
+
+class BoundedORJSONParser(ORJSONParser):
+    # DRF reads the raw request stream, which bypasses Django's
+    # DATA_UPLOAD_MAX_MEMORY_SIZE check (only enforced on request.body), so
+    # apply the limit here before anything is decoded.
+    def parse(self, stream, media_type=None, parser_context=None):
+        limit = settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+
+        if limit is None:
+            body = stream.read()
+        else:
+            # Read one byte past the limit rather than trusting Content-Length
+            body = stream.read(limit + 1)
+            if len(body) > limit:
+                raise PayloadTooLarge()
+
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
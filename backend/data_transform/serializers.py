@@ -1,18 +1,95 @@
+import copy
+
 from rest_framework import serializers
+from rest_framework.fields import empty
+from rest_framework.settings import api_settings
 from typing import Any, Dict, List, Union
-import pandas as pd
-import numpy as np
 
 
-class DataTransformationInputSerializer(serializers.Serializer):
-    data = serializers.ListField(
+REQUIRED_PARAMETERS = {
+    'aggregate': ('group_by',),
+    'filter': ('conditions',),
+    'normalize': ('columns',),
+    'pivot': ('index', 'columns', 'values'),
+}
+
+
+def _describe_parameters(keys) -> str:
+    quoted = [f"'{key}'" for key in keys]
+    if len(quoted) == 1:
+        return f"{quoted[0]} parameter"
+    return f"{', '.join(quoted[:-1])}, and {quoted[-1]} parameters"
+
+
+def check_required_parameters(transformation_type: str, value: Dict[str, Any]) -> None:
+    required = REQUIRED_PARAMETERS.get(transformation_type, ())
+
+    if any(key not in value for key in required):
+        raise serializers.ValidationError(
+            f"{transformation_type.capitalize()} transformation requires "
+            f"{_describe_parameters(required)}"
+        )
+
+
+class CachedFieldsSerializer(serializers.Serializer):
+    # DRF deep-copies every declared field (re-running ChoiceField choice
+    # parsing) each time a serializer is instantiated. The declared fields
+    # are never bound or mutated, so a shallow copy per instance is enough
+    # to keep binding isolated while sharing the parsed choices/validators.
+    def get_fields(self):
+        return {
+            name: copy.copy(field)
+            for name, field in self._declared_fields.items()
+        }
+
+
+class FrozenChoiceField(serializers.ChoiceField):
+    # All choices in this module are plain strings, so validation can be a
+    # single frozenset membership test instead of DRF's str() coercion and
+    # dict lookup.
+    def _set_choices(self, choices):
+        super()._set_choices(choices)
+        self.choice_set = frozenset(self._choices)
+
+    choices = property(serializers.ChoiceField._get_choices, _set_choices)
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) and data in self.choice_set:
+            return data
+
+        if data == '' and self.allow_blank:
+            return ''
+
+        self.fail('invalid_choice', input=data)
+
+
+class RecordListField(serializers.ListField):
+    # Rows are handed to pandas as-is, so only check that each one is an
+    # object instead of running DictField validation over every key/value.
+    # The child field is still declared so the schema documents the items.
+    def run_child_validation(self, data):
+        errors = {}
+
+        for idx, item in enumerate(data):
+            if not isinstance(item, dict):
+                errors[idx] = [self.child.error_messages['not_a_dict'].format(
+                    input_type=type(item).__name__)]
+
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        return list(data)
+
+
+class DataTransformationInputSerializer(CachedFieldsSerializer):
+    data = RecordListField(
         child=serializers.DictField(),
         help_text="Array of objects to transform",
         min_length=1,
         max_length=10000  # Limit for performance
     )
 
-    transformation_type = serializers.ChoiceField(
+    transformation_type = FrozenChoiceField(
         choices=[
             ('aggregate', 'Aggregate data by key'),
             ('filter', 'Filter data based on conditions'),
@@ -32,45 +109,30 @@ class DataTransformationInputSerializer(serializers.Serializer):
         if not value:
             raise serializers.ValidationError("Data cannot be empty")
 
-        first_keys = set(value[0].keys())
-        for i, obj in enumerate(value[1:], 1):
-            if set(obj.keys()) != first_keys:
+        # dict key views compare as sets in C, without building a set per row
+        first_keys = value[0].keys()
+        for i in range(1, len(value)):
+            obj_keys = value[i].keys()
+            if obj_keys != first_keys:
                 raise serializers.ValidationError(
                     f"Object at index {i} has different keys than first object. "
-                    f"Expected keys: {first_keys}, got: {set(obj.keys())}"
+                    f"Expected keys: {set(first_keys)}, got: {set(obj_keys)}"
                 )
 
         return value
 
     def validate_parameters(self, value: Dict[str, Any]) -> Dict[str, Any]:
         transformation_type = self.initial_data.get('transformation_type')
+        if not isinstance(transformation_type, str):
+            # Left for the transformation_type field to reject
+            return value
 
-        if transformation_type == 'aggregate' and 'group_by' not in value:
-            raise serializers.ValidationError(
-                "Aggregate transformation requires 'group_by' parameter"
-            )
-
-        if transformation_type == 'filter' and 'conditions' not in value:
-            raise serializers.ValidationError(
-                "Filter transformation requires 'conditions' parameter"
-            )
-
-        if transformation_type == 'normalize' and 'columns' not in value:
-            raise serializers.ValidationError(
-                "Normalize transformation requires 'columns' parameter"
-            )
-
-        if transformation_type == 'pivot' and not all(
-            key in value for key in ['index', 'columns', 'values']
-        ):
-            raise serializers.ValidationError(
-                "Pivot transformation requires 'index', 'columns', and 'values' parameters"
-            )
+        check_required_parameters(transformation_type, value)
 
         return value
 
 
-class DataTransformationOutputSerializer(serializers.Serializer):
+class DataTransformationOutputSerializer(CachedFieldsSerializer):
     success = serializers.BooleanField(default=True)
     message = serializers.CharField()
     data = serializers.ListField(
@@ -85,46 +147,148 @@ class DataTransformationOutputSerializer(serializers.Serializer):
     )
 
 
-class FilterConditionSerializer(serializers.Serializer):
-    field = serializers.CharField(help_text="Field name to filter on")
-    operator = serializers.ChoiceField(
+def column_name_field(**kwargs) -> serializers.CharField:
+    # Column names are matched verbatim against the record keys, so padded
+    # or empty names must not be trimmed or rejected
+    return serializers.CharField(trim_whitespace=False, allow_blank=True, **kwargs)
+
+
+class ColumnListField(serializers.ListField):
+    # A single column name was accepted before the parameters were
+    # validated per type, so keep taking it and hand it on as a list
+    def to_internal_value(self, data):
+        if isinstance(data, str):
+            data = [data]
+        return super().to_internal_value(data)
+
+
+class ParametersSerializer(CachedFieldsSerializer):
+    # Missing required parameters are reported before the individual fields,
+    # with the same message the generic input serializer gives. DRF would
+    # return an omitted block's default without validating it, so check the
+    # default too
+    transformation_type = None
+
+    def run_validation(self, data=empty):
+        if data is empty and self.default is not empty:
+            data = self.get_default()
+        if isinstance(data, dict):
+            check_required_parameters(self.transformation_type, data)
+        return super().run_validation(data)
+
+
+class FilterConditionSerializer(CachedFieldsSerializer):
+    field = column_name_field(help_text="Field name to filter on")
+    operator = FrozenChoiceField(
         choices=['eq', 'ne', 'gt', 'gte', 'lt', 'lte', 'contains', 'in'],
         help_text="Comparison operator"
     )
     value = serializers.JSONField(help_text="Value to compare against")
 
 
-class AggregationSerializer(serializers.Serializer):
-    group_by = serializers.ListField(
-        child=serializers.CharField(),
+# Stateless once built, so one instance validates every filter condition
+FILTER_CONDITION_SERIALIZER = FilterConditionSerializer()
+
+
+class FilterSerializer(ParametersSerializer):
+    transformation_type = 'filter'
+
+    conditions = serializers.JSONField(
+        help_text="A filter condition, or a list of conditions combined with AND"
+    )
+
+    def validate_conditions(self, value: Any) -> Any:
+        many = isinstance(value, list)
+        conditions = value if many else [value]
+
+        if not conditions:
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    serializers.ListSerializer.default_error_messages['empty']]
+            }, code='empty')
+
+        # Validate each condition with the shared serializer rather than
+        # building a ListSerializer per request; errors keep its per-item shape
+        validated, errors = [], []
+        for condition in conditions:
+            try:
+                validated.append(FILTER_CONDITION_SERIALIZER.run_validation(condition))
+                errors.append({})
+            except serializers.ValidationError as exc:
+                errors.append(exc.detail)
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+        return validated if many else validated[0]
+
+
+class AggregationSerializer(ParametersSerializer):
+    transformation_type = 'aggregate'
+
+    group_by = ColumnListField(
+        child=column_name_field(),
         help_text="Fields to group by"
     )
     aggregations = serializers.DictField(
-        child=serializers.ChoiceField(
+        child=FrozenChoiceField(
             choices=['sum', 'mean', 'count', 'min', 'max', 'std']
         ),
+        default=dict,
         help_text="Field to aggregation function mapping"
     )
 
 
-class NormalizationSerializer(serializers.Serializer):
+class NormalizationSerializer(ParametersSerializer):
+    transformation_type = 'normalize'
+
     columns = serializers.ListField(
-        child=serializers.CharField(),
+        child=column_name_field(),
         help_text="Columns to normalize"
     )
-    method = serializers.ChoiceField(
+    method = FrozenChoiceField(
         choices=['min_max', 'z_score', 'robust'],
         default='min_max',
         help_text="Normalization method"
     )
 
 
-class PivotSerializer(serializers.Serializer):
-    index = serializers.CharField(help_text="Column to use as index")
-    columns = serializers.CharField(help_text="Column to use as columns")
-    values = serializers.CharField(help_text="Column to use as values")
-    aggfunc = serializers.ChoiceField(
+class PivotSerializer(ParametersSerializer):
+    transformation_type = 'pivot'
+
+    index = column_name_field(help_text="Column to use as index")
+    columns = column_name_field(help_text="Column to use as columns")
+    values = column_name_field(help_text="Column to use as values")
+    aggfunc = FrozenChoiceField(
         choices=['sum', 'mean', 'count', 'min', 'max'],
         default='sum',
         help_text="Aggregation function for duplicate entries"
     )
+
+
+def _build_input_serializer(transformation_type: str, parameters_serializer):
+    return type(
+        f"{transformation_type.capitalize()}TransformationInputSerializer",
+        (DataTransformationInputSerializer,),
+        {'parameters': parameters_serializer(
+            required=False,
+            default=dict,
+            help_text=f"Parameters for the {transformation_type} transformation")},
+    )
+
+
+# Input serializers that validate the parameters against the schema of one
+# transformation type, built once at import.
+INPUT_SERIALIZERS = {
+    'aggregate': _build_input_serializer('aggregate', AggregationSerializer),
+    'filter': _build_input_serializer('filter', FilterSerializer),
+    'normalize': _build_input_serializer('normalize', NormalizationSerializer),
+    'pivot': _build_input_serializer('pivot', PivotSerializer),
+}
+
+
+def get_input_serializer_class(transformation_type: Any):
+    if isinstance(transformation_type, str):
+        return INPUT_SERIALIZERS.get(
+            transformation_type, DataTransformationInputSerializer)
+    return DataTransformationInputSerializer
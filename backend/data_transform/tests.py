@@ -1,40 +1,54 @@
+import copy
+import functools
+import warnings
 import pytest
 import json
 from unittest.mock import patch, MagicMock
-from django.test import TestCase, Client
+from django.test import TestCase, Client, override_settings
 from django.urls import reverse
-from rest_framework.test import APITestCase, APIClient
+from rest_framework.test import APITestCase
 from rest_framework import status
 
 from .serializers import (
     DataTransformationInputSerializer,
     DataTransformationOutputSerializer,
-)
-from .transformations import (
-    aggregate_data,
-    filter_data,
-    normalize_data,
-    pivot_data,
-    apply_transformation,
-    TRANSFORMATION_FUNCTIONS,
+    get_input_serializer_class,
 )
 
-class TransformationFunctionsTest(TestCase):
 
-    def setUp(self):
-        self.sample_data = [
-            {"region": "North", "sales": 100, "product": "A", "quantity": 10},
-            {"region": "North", "sales": 150, "product": "B", "quantity": 5},
-            {"region": "South", "sales": 200, "product": "A", "quantity": 8},
-            {"region": "South", "sales": 120, "product": "B", "quantity": 12},
-        ]
+@functools.cache
+def cached_reverse(viewname):
+    # URL patterns don't change during a run, so resolve each name once
+    return reverse(viewname)
 
-        self.people_data = [
-            {"name": "Alice", "age": 30, "city": "New York", "salary": 50000},
-            {"name": "Bob", "age": 25, "city": "Los Angeles", "salary": 60000},
-            {"name": "Charlie", "age": 35, "city": "New York", "salary": 70000},
-            {"name": "Diana", "age": 28, "city": "Chicago", "salary": 55000},
-        ]
+
+class TransformationsTestMixin:
+    # The transformation module pulls in pandas/numpy, so it is imported only
+    # by the classes that exercise it; serializer-only runs skip that cost.
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        from . import transformations
+        cls.transformations = transformations
+
+
+class TransformationFunctionsTest(TransformationsTestMixin, TestCase):
+
+    # Fixtures are built once per class and shared by every test, which also
+    # means any transformation that mutates its input breaks later tests.
+    sample_data = [
+        {"region": "North", "sales": 100, "product": "A", "quantity": 10},
+        {"region": "North", "sales": 150, "product": "B", "quantity": 5},
+        {"region": "South", "sales": 200, "product": "A", "quantity": 8},
+        {"region": "South", "sales": 120, "product": "B", "quantity": 12},
+    ]
+
+    people_data = [
+        {"name": "Alice", "age": 30, "city": "New York", "salary": 50000},
+        {"name": "Bob", "age": 25, "city": "Los Angeles", "salary": 60000},
+        {"name": "Charlie", "age": 35, "city": "New York", "salary": 70000},
+        {"name": "Diana", "age": 28, "city": "Chicago", "salary": 55000},
+    ]
 
     def test_aggregate_data_basic(self):
         parameters = {
@@ -42,7 +56,7 @@ class TransformationFunctionsTest(TestCase):
             "aggregations": {"sales": "sum", "quantity": "mean"}
         }
 
-        result = aggregate_data(self.sample_data, parameters)
+        result = self.transformations.aggregate_data(self.sample_data, parameters)
 
         self.assertIn("data", result)
         self.assertIn("metadata", result)
@@ -50,21 +64,91 @@ class TransformationFunctionsTest(TestCase):
         self.assertEqual(result["metadata"]["original_rows"], 4)
         self.assertEqual(result["metadata"]["transformed_rows"], 2)
 
+    def test_aggregate_data_values(self):
+        parameters = {
+            "group_by": ["region"],
+            "aggregations": {"sales": "sum", "quantity": "mean"}
+        }
+
+        result = self.transformations.aggregate_data(self.sample_data, parameters)
+
+        self.assertEqual(result["data"], [
+            {"region": "North", "sales": 250, "quantity": 7.5},
+            {"region": "South", "sales": 320, "quantity": 10.0},
+        ])
+
+    def test_aggregate_data_float_values(self):
+        data = [{"region": "North", "price": price} for price in (28.42, 64.85, 69.62, 29.27)]
+        parameters = {
+            "group_by": ["region"],
+            "aggregations": {"price": "sum"}
+        }
+
+        result = self.transformations.aggregate_data(data, parameters)
+
+        # pandas' compensated summation gives 192.16, not 192.16000000000003
+        self.assertEqual(result["data"], [{"region": "North", "price": 192.16}])
+
+    def test_aggregate_data_large_int_mean(self):
+        timestamps = [1700000000000000000 + i * 1000000007 for i in range(6)]
+        data = [{"region": "North", "ts": ts} for ts in timestamps]
+        parameters = {
+            "group_by": ["region"],
+            "aggregations": {"ts": "mean"}
+        }
+
+        result = self.transformations.aggregate_data(data, parameters)
+
+        self.assertEqual(result["data"], [{"region": "North", "ts": 1.7000000025e18}])
+
+    def test_aggregate_data_with_missing_values(self):
+        data = [
+            {"region": "North", "sales": 100},
+            {"region": "North", "sales": None},
+            {"region": "South", "sales": 200},
+        ]
+        parameters = {
+            "group_by": ["region"],
+            "aggregations": {"sales": "count"}
+        }
+
+        result = self.transformations.aggregate_data(data, parameters)
+
+        self.assertEqual(result["data"], [
+            {"region": "North", "sales": 1},
+            {"region": "South", "sales": 1},
+        ])
+
     def test_aggregate_data_count_only(self):
         parameters = {"group_by": ["region"]}
 
-        result = aggregate_data(self.sample_data, parameters)
+        result = self.transformations.aggregate_data(self.sample_data, parameters)
 
         self.assertIn("data", result)
         self.assertEqual(len(result["data"]), 2)
         self.assertIn("count", result["data"][0])
 
+    def test_aggregate_data_count_only_values(self):
+        data = [
+            {"region": "South", "sales": 1},
+            {"region": None, "sales": 2},
+            {"region": "North", "sales": 3},
+            {"region": "South", "sales": 4},
+        ]
+
+        result = self.transformations.aggregate_data(data, {"group_by": ["region"]})
+
+        self.assertEqual(result["data"], [
+            {"region": "North", "count": 1},
+            {"region": "South", "count": 2},
+        ])
+
     def test_filter_data_single_condition(self):
         parameters = {
             "conditions": {"field": "age", "operator": "gte", "value": 30}
         }
 
-        result = filter_data(self.people_data, parameters)
+        result = self.transformations.filter_data(self.people_data, parameters)
 
         self.assertIn("data", result)
         self.assertEqual(len(result["data"]), 2)
@@ -78,7 +162,7 @@ class TransformationFunctionsTest(TestCase):
             ]
         }
 
-        result = filter_data(self.people_data, parameters)
+        result = self.transformations.filter_data(self.people_data, parameters)
 
         self.assertIn("data", result)
         self.assertEqual(len(result["data"]), 2)
@@ -88,7 +172,7 @@ class TransformationFunctionsTest(TestCase):
             "conditions": {"field": "name", "operator": "contains", "value": "li"}
         }
 
-        result = filter_data(self.people_data, parameters)
+        result = self.transformations.filter_data(self.people_data, parameters)
 
         self.assertIn("data", result)
         self.assertEqual(len(result["data"]), 2)  # Alice and Charlie
@@ -98,18 +182,89 @@ class TransformationFunctionsTest(TestCase):
             "conditions": {"field": "city", "operator": "in", "value": ["New York", "Chicago"]}
         }
 
-        result = filter_data(self.people_data, parameters)
+        result = self.transformations.filter_data(self.people_data, parameters)
 
         self.assertIn("data", result)
         self.assertEqual(len(result["data"]), 3)
 
+    def test_filter_data_with_missing_values(self):
+        data = [
+            {"name": "Alice", "age": 30},
+            {"name": "Bob", "age": None},
+            {"name": "Charlie", "age": 35},
+        ]
+        parameters = {
+            "conditions": {"field": "age", "operator": "gt", "value": 25}
+        }
+
+        result = self.transformations.filter_data(data, parameters)
+
+        self.assertEqual(
+            [row["name"] for row in result["data"]], ["Alice", "Charlie"])
+
+    def test_filter_data_paths_return_same_types(self):
+        datasets = [
+            [
+                {"id": 1, "price": 10, "disc": None},
+                {"id": 2, "price": 12.5, "disc": 3},
+            ],
+            [
+                {"id": 1, "price": 10, "name": "a"},
+                {"id": 2, "price": 12, "name": "b"},
+            ],
+        ]
+        parameters = {
+            "conditions": {"field": "id", "operator": "gte", "value": 1}
+        }
+
+        def typed(records):
+            return [[(key, type(value), value) for key, value in row.items()]
+                    for row in records]
+
+        for data in datasets:
+            with self.subTest(data=data):
+                result = self.transformations.filter_data(data, parameters)
+                frame_df, _ = self.transformations.filter_dataframe(
+                    self.transformations.to_dataframe(data), parameters)
+
+                self.assertEqual(
+                    typed(result["data"]),
+                    typed(self.transformations.from_dataframe(frame_df)))
+
+    def test_filter_data_above_python_threshold(self):
+        rows = self.transformations.PYTHON_FILTER_MAX_ROWS + 1
+        data = [{"id": i, "even": i % 2 == 0} for i in range(rows)]
+        parameters = {
+            "conditions": [
+                {"field": "even", "operator": "eq", "value": True},
+                {"field": "id", "operator": "lt", "value": 10}
+            ]
+        }
+
+        result = self.transformations.filter_data(data, parameters)
+
+        self.assertEqual([row["id"] for row in result["data"]], [0, 2, 4, 6, 8])
+
+    def test_missing_values_returned_as_none(self):
+        data = [
+            {"name": "Alice", "salary": 50000.0},
+            {"name": "Charlie", "salary": None},
+        ]
+        parameters = {
+            "conditions": {"field": "name", "operator": "contains", "value": "li"}
+        }
+
+        result = self.transformations.filter_data(data, parameters)
+
+        self.assertEqual(result["data"], data)
+
     def test_normalize_data_min_max(self):
         parameters = {
             "columns": ["salary"],
             "method": "min_max"
         }
 
-        result = normalize_data(self.people_data, parameters)
+        result = self.transformations.normalize_data(self.people_data, parameters)
 
         self.assertIn("data", result)
         self.assertIn("metadata", result)
@@ -124,12 +279,69 @@ class TransformationFunctionsTest(TestCase):
             "method": "z_score"
         }
 
-        result = normalize_data(self.people_data, parameters)
+        result = self.transformations.normalize_data(self.people_data, parameters)
 
         self.assertIn("data", result)
         self.assertIn("metadata", result)
         self.assertEqual(len(result["metadata"]["normalized_columns"]), 2)
 
+    def test_normalize_data_robust(self):
+        parameters = {"columns": ["age"], "method": "robust"}
+
+        result = self.transformations.normalize_data(self.people_data, parameters)
+
+        # ages 25, 28, 30, 35: median 29, interquartile range 31.25 - 27.25
+        self.assertEqual(
+            [row["age"] for row in result["data"]], [0.25, -1.0, 1.5, -0.25])
+
+    def test_normalize_data_constant_and_missing_values(self):
+        data = [
+            {"flat": 5, "sparse": 1.0},
+            {"flat": 5, "sparse": None},
+            {"flat": 5, "sparse": 3.0},
+        ]
+        parameters = {"columns": ["flat", "sparse"], "method": "min_max"}
+
+        result = self.transformations.normalize_data(data, parameters)
+
+        self.assertEqual([row["flat"] for row in result["data"]], [0.0, 0.0, 0.0])
+        self.assertEqual([row["sparse"] for row in result["data"]], [0.0, 0.0, 1.0])
+        self.assertEqual(result["metadata"]["statistics"]["sparse"]["original_mean"], 2.0)
+
+    def test_normalize_dataframe_sparse_columns_do_not_warn(self):
+        df = self.transformations.to_dataframe(
+            [{"empty": float("nan"), "single": 1.0}, {"empty": float("nan"), "single": None}])
+
+        for method in ["min_max", "z_score", "robust"]:
+            with self.subTest(method=method), warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                result_df, metadata = self.transformations.normalize_dataframe(
+                    df, {"columns": ["empty", "single"], "method": method})
+
+            self.assertEqual(caught, [])
+            self.assertEqual(result_df.to_numpy().tolist(), [[0.0, 0.0], [0.0, 0.0]])
+            self.assertEqual(metadata["statistics"]["single"]["original_mean"], 1.0)
+
+    def test_transformations_do_not_mutate_input(self):
+        snapshot = copy.deepcopy(self.people_data)
+
+        self.transformations.normalize_data(
+            self.people_data, {"columns": ["salary", "age"]})
+        self.transformations.filter_data(self.people_data, {
+            "conditions": {"field": "age", "operator": "gte", "value": 30}
+        })
+
+        self.assertEqual(self.people_data, snapshot)
+
+    def test_normalize_dataframe_leaves_input_frame_untouched(self):
+        df = self.transformations.to_dataframe(self.people_data)
+
+        result_df, _ = self.transformations.normalize_dataframe(
+            df, {"columns": ["salary"]})
+
+        self.assertEqual(df["salary"].tolist(), [50000, 60000, 70000, 55000])
+        self.assertEqual(result_df["salary"].tolist(), [0.0, 0.5, 1.0, 0.25])
+
     def test_pivot_data(self):
         parameters = {
             "index": "region",
@@ -138,7 +350,7 @@ class TransformationFunctionsTest(TestCase):
             "aggfunc": "sum"
         }
 
-        result = pivot_data(self.sample_data, parameters)
+        result = self.transformations.pivot_data(self.sample_data, parameters)
 
         self.assertIn("data", result)
         self.assertIn("metadata", result)
@@ -147,7 +359,7 @@ class TransformationFunctionsTest(TestCase):
     def test_apply_transformation_dispatcher(self):
         parameters = {"group_by": ["region"]}
 
-        result = apply_transformation(
+        result = self.transformations.apply_transformation(
             self.sample_data, "aggregate", parameters)
 
         self.assertIn("data", result)
@@ -155,7 +367,8 @@ class TransformationFunctionsTest(TestCase):
 
     def test_apply_transformation_invalid_type(self):
         with self.assertRaises(ValueError):
-            apply_transformation(self.sample_data, "invalid_transform", {})
+            self.transformations.apply_transformation(
+                self.sample_data, "invalid_transform", {})
 
     def test_transformation_error_handling(self):
         parameters = {
@@ -163,7 +376,7 @@ class TransformationFunctionsTest(TestCase):
         }
 
         with self.assertRaises(ValueError):
-            aggregate_data(self.sample_data, parameters)
+            self.transformations.aggregate_data(self.sample_data, parameters)
 
     def test_filter_invalid_field(self):
         parameters = {
@@ -171,7 +384,11 @@ class TransformationFunctionsTest(TestCase):
         }
 
         with self.assertRaises(ValueError):
-            filter_data(self.people_data, parameters)
+            self.transformations.filter_data(self.people_data, parameters)
+
+    def test_filter_no_conditions(self):
+        with self.assertRaises(ValueError):
+            self.transformations.filter_data(self.people_data, {"conditions": []})
 
     def test_normalize_no_numeric_columns(self):
         text_data = [
@@ -182,7 +399,7 @@ class TransformationFunctionsTest(TestCase):
         parameters = {"columns": ["name", "city"]}
 
         with self.assertRaises(ValueError):
-            normalize_data(text_data, parameters)
+            self.transformations.normalize_data(text_data, parameters)
 
 
 class SerializerTest(TestCase):
@@ -229,6 +446,41 @@ class SerializerTest(TestCase):
         self.assertFalse(serializer.is_valid())
         self.assertIn("data", serializer.errors)
 
+    def test_input_serializer_non_object_row(self):
+        invalid_data = dict(
+            self.valid_input_data,
+            data=[{"name": "Alice", "age": 30}, ["Bob", 25]])
+
+        serializer = DataTransformationInputSerializer(data=invalid_data)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn(1, serializer.errors["data"])
+
+    def test_input_serializer_keys_in_different_order(self):
+        valid_data = {
+            "data": [
+                {"name": "Alice", "age": 30},
+                {"age": 25, "name": "Bob"}
+            ],
+            "transformation_type": "filter",
+            "parameters": {
+                "conditions": {"field": "age", "operator": "gte", "value": 30}
+            }
+        }
+
+        serializer = DataTransformationInputSerializer(data=valid_data)
+        self.assertTrue(serializer.is_valid())
+
+    def test_input_serializer_invalid_transformation_type(self):
+        for transformation_type in ["explode", ["filter"], 1]:
+            with self.subTest(transformation_type=transformation_type):
+                invalid_data = dict(
+                    self.valid_input_data,
+                    transformation_type=transformation_type)
+
+                serializer = DataTransformationInputSerializer(data=invalid_data)
+                self.assertFalse(serializer.is_valid())
+                self.assertIn("transformation_type", serializer.errors)
+
     def test_input_serializer_parameter_validation(self):
         invalid_data = {
             "data": [{"name": "Alice", "age": 30}],
@@ -240,6 +492,123 @@ class SerializerTest(TestCase):
         self.assertFalse(serializer.is_valid())
         self.assertIn("parameters", serializer.errors)
 
+    def test_input_serializer_pivot_parameter_validation(self):
+        invalid_data = {
+            "data": [{"name": "Alice", "age": 30}],
+            "transformation_type": "pivot",
+            "parameters": {"index": "name", "columns": "age"}
+        }
+
+        serializer = DataTransformationInputSerializer(data=invalid_data)
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(
+            str(serializer.errors["parameters"][0]),
+            "Pivot transformation requires 'index', 'columns', and 'values' parameters"
+        )
+
+    def test_input_serializer_fields_not_shared(self):
+        first = DataTransformationInputSerializer(data=self.valid_input_data)
+        second = DataTransformationInputSerializer(data=self.valid_input_data)
+
+        self.assertIsNot(first.fields["data"], second.fields["data"])
+        self.assertIs(first.fields["data"].parent, first)
+        self.assertIs(second.fields["data"].parent, second)
+        self.assertTrue(first.is_valid())
+        self.assertTrue(second.is_valid())
+
+    def test_specialized_serializer_validates_parameters(self):
+        serializer_class = get_input_serializer_class("filter")
+        self.assertIsNot(serializer_class, DataTransformationInputSerializer)
+
+        serializer = serializer_class(data=self.valid_input_data)
+        self.assertTrue(serializer.is_valid())
+
+        invalid_data = dict(self.valid_input_data, parameters={
+            "conditions": [{"field": "age", "operator": "between", "value": 1}]
+        })
+        serializer = serializer_class(data=invalid_data)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("parameters", serializer.errors)
+
+    def test_specialized_serializer_required_parameters_message(self):
+        invalid_data = {
+            "data": [{"name": "Alice", "age": 30}],
+            "transformation_type": "pivot",
+            "parameters": {"index": "name", "columns": "age"}
+        }
+
+        serializer = get_input_serializer_class("pivot")(data=invalid_data)
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(
+            str(serializer.errors["parameters"][0]),
+            "Pivot transformation requires 'index', 'columns', and 'values' parameters"
+        )
+
+        del invalid_data["parameters"]
+        serializer = get_input_serializer_class("pivot")(data=invalid_data)
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(
+            str(serializer.errors["parameters"][0]),
+            "Pivot transformation requires 'index', 'columns', and 'values' parameters"
+        )
+
+    def test_specialized_serializer_keeps_column_names_verbatim(self):
+        parameters = {
+            "aggregate": {"group_by": [" region", ""]},
+            "filter": {"conditions": {"field": " age ", "operator": "eq", "value": 1}},
+            "normalize": {"columns": [" age"]},
+            "pivot": {"index": " name", "columns": "", "values": "age "},
+        }
+
+        for transformation_type, params in parameters.items():
+            with self.subTest(transformation_type=transformation_type):
+                serializer = get_input_serializer_class(transformation_type)(data=dict(
+                    self.valid_input_data,
+                    transformation_type=transformation_type,
+                    parameters=params))
+                self.assertTrue(serializer.is_valid(), serializer.errors)
+
+                validated = serializer.validated_data["parameters"]
+                for key, value in params.items():
+                    if key == "conditions":
+                        self.assertEqual(validated[key]["field"], value["field"])
+                    else:
+                        self.assertEqual(validated[key], value)
+
+    def test_specialized_serializer_accepts_single_group_by_column(self):
+        serializer = get_input_serializer_class("aggregate")(data=dict(
+            self.valid_input_data,
+            transformation_type="aggregate",
+            parameters={"group_by": "name"}))
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data["parameters"]["group_by"], ["name"])
+
+    def test_filter_conditions_errors_per_item(self):
+        serializer_class = get_input_serializer_class("filter")
+        invalid_data = dict(self.valid_input_data, parameters={"conditions": [
+            {"field": "age", "operator": "gte", "value": 30},
+            {"field": "age", "operator": "between", "value": 1},
+        ]})
+
+        serializer = serializer_class(data=invalid_data)
+        self.assertFalse(serializer.is_valid())
+
+        errors = serializer.errors["parameters"]["conditions"]
+        self.assertEqual(errors[0], {})
+        self.assertIn("operator", errors[1])
+
+        serializer = serializer_class(
+            data=dict(self.valid_input_data, parameters={"conditions": []}))
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("non_field_errors", serializer.errors["parameters"]["conditions"])
+
+    def test_unknown_type_falls_back_to_generic_serializer(self):
+        for transformation_type in ["explode", ["filter"], None]:
+            with self.subTest(transformation_type=transformation_type):
+                self.assertIs(
+                    get_input_serializer_class(transformation_type),
+                    DataTransformationInputSerializer)
+
     def test_output_serializer(self):
         output_data = {
             "success": True,
@@ -255,16 +624,15 @@ class SerializerTest(TestCase):
 
 class APIEndpointTest(APITestCase):
 
-    def setUp(self):
-        self.client = APIClient()
-        self.sample_data = [
-            {"region": "North", "sales": 100, "product": "A"},
-            {"region": "North", "sales": 150, "product": "B"},
-            {"region": "South", "sales": 200, "product": "A"},
-        ]
+    # APITestCase already provides a fresh APIClient as self.client
+    sample_data = [
+        {"region": "North", "sales": 100, "product": "A"},
+        {"region": "North", "sales": 150, "product": "B"},
+        {"region": "South", "sales": 200, "product": "A"},
+    ]
 
     def test_health_check_endpoint(self):
-        url = reverse("data_transform:health_check")
+        url = cached_reverse("data_transform:health_check")
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -272,7 +640,7 @@ class APIEndpointTest(APITestCase):
         self.assertEqual(response.data["status"], "healthy")
 
     def test_transformation_types_endpoint(self):
-        url = reverse("data_transform:transformation_types")
+        url = cached_reverse("data_transform:transformation_types")
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -281,7 +649,7 @@ class APIEndpointTest(APITestCase):
         self.assertIn("aggregate", response.data["available_transformations"])
 
     def test_transform_endpoint_success(self):
-        url = reverse("data_transform:transform")
+        url = cached_reverse("data_transform:transform")
         data = {
             "data": self.sample_data,
             "transformation_type": "aggregate",
@@ -300,7 +668,7 @@ class APIEndpointTest(APITestCase):
         self.assertIn("processing_time_ms", response.data)
 
     def test_transform_endpoint_validation_error(self):
-        url = reverse("data_transform:transform")
+        url = cached_reverse("data_transform:transform")
         data = {
             "data": [],
             "transformation_type": "aggregate",
@@ -314,7 +682,7 @@ class APIEndpointTest(APITestCase):
         self.assertIn("errors", response.data)
 
     def test_transform_endpoint_transformation_error(self):
-        url = reverse("data_transform:transform")
+        url = cached_reverse("data_transform:transform")
         data = {
             "data": self.sample_data,
             "transformation_type": "aggregate",
@@ -328,8 +696,57 @@ class APIEndpointTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertFalse(response.data["success"])
 
+    def test_transform_endpoint_invalid_parameters(self):
+        url = cached_reverse("data_transform:transform")
+        data = {
+            "data": self.sample_data,
+            "transformation_type": "normalize",
+            "parameters": {"columns": ["sales"], "method": "log"}
+        }
+
+        response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("parameters", response.data["errors"])
+
+    def test_transform_endpoint_padded_column_names(self):
+        url = cached_reverse("data_transform:transform")
+        data = {
+            "data": [{" region": "N", "x": 1}, {" region": "S", "x": 2}],
+            "transformation_type": "aggregate",
+            "parameters": {"group_by": [" region"]}
+        }
+
+        response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["data"], [{" region": "N", "count": 1}, {" region": "S", "count": 1}])
+
+    @override_settings(DATA_UPLOAD_MAX_MEMORY_SIZE=64)
+    def test_transform_endpoint_payload_too_large(self):
+        url = cached_reverse("data_transform:transform")
+        data = {
+            "data": self.sample_data,
+            "transformation_type": "aggregate",
+            "parameters": {"group_by": ["region"]}
+        }
+
+        response = self.client.post(url, data, format="json")
+
+        self.assertEqual(
+            response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+    def test_transform_endpoint_malformed_json(self):
+        url = cached_reverse("data_transform:transform")
+
+        response = self.client.post(
+            url, '{"data": [', content_type="application/json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_batch_transform_endpoint(self):
-        url = reverse("data_transform:batch_transform")
+        url = cached_reverse("data_transform:batch_transform")
         data = {
             "data": self.sample_data,
             "transformations": [
@@ -350,15 +767,69 @@ class APIEndpointTest(APITestCase):
         }
 
         response = self.client.post(url, data, format="json")
+        body = json.loads(b"".join(response.streaming_content))
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertTrue(response.data["success"])
-        self.assertIn("transformation_steps", response.data)
-        self.assertEqual(len(response.data["transformation_steps"]), 2)
+        self.assertTrue(body["success"])
+        self.assertIn("transformation_steps", body)
+        self.assertEqual(len(body["transformation_steps"]), 2)
+        self.assertEqual(body["data"], [
+            {"region": "North", "sales": 250},
+            {"region": "South", "sales": 200},
+        ])
+
+    @patch("data_transform.views.STREAM_CHUNK_ROWS", 3)
+    def test_batch_transform_streams_rows_in_chunks(self):
+        url = cached_reverse("data_transform:batch_transform")
+        rows = [{"id": i, "value": i * 1.5} for i in range(7)]
+        data = {
+            "data": rows,
+            "transformations": [
+                {
+                    "transformation_type": "filter",
+                    "parameters": {
+                        "conditions": {"field": "id", "operator": "gte", "value": 0}
+                    }
+                }
+            ]
+        }
+
+        response = self.client.post(url, data, format="json")
+        body = json.loads(b"".join(response.streaming_content))
+
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(body["data"], rows)
+        self.assertEqual(body["transformation_steps"][0]["metadata"]["filtered_rows"], 7)
+
+    def test_batch_transform_step_after_empty_result(self):
+        url = cached_reverse("data_transform:batch_transform")
+        data = {
+            "data": self.sample_data,
+            "transformations": [
+                {
+                    "transformation_type": "filter",
+                    "parameters": {
+                        "conditions": {"field": "sales", "operator": "gt", "value": 1000}
+                    }
+                },
+                {
+                    "transformation_type": "aggregate",
+                    "parameters": {"group_by": ["region"]}
+                }
+            ]
+        }
+
+        response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["step"], 2)
+        self.assertEqual(
+            response.data["error"],
+            "Transformation failed at step 2: Transformation failed: Data cannot be empty")
 
     def test_batch_transform_missing_data(self):
         """Test batch transformation with missing data."""
-        url = reverse("data_transform:batch_transform")
+        url = cached_reverse("data_transform:batch_transform")
         data = {
             "transformations": []
         }
@@ -370,7 +841,7 @@ class APIEndpointTest(APITestCase):
 
     def test_batch_transform_step_failure(self):
         """Test batch transformation with step failure."""
-        url = reverse("data_transform:batch_transform")
+        url = cached_reverse("data_transform:batch_transform")
         data = {
             "data": self.sample_data,
             "transformations": [
@@ -387,64 +858,94 @@ class APIEndpointTest(APITestCase):
         self.assertIn("error", response.data)
         self.assertIn("step", response.data)
 
-class IntegrationTest(APITestCase):
-    """Integration tests for complete workflows."""
+class TransformDispatcherTest(TransformationsTestMixin, TestCase):
+    """Workflow tests that call the dispatcher directly, without HTTP."""
+
+    sales_data = [
+        {"date": "2024-01-01", "region": "North",
+            "product": "A", "sales": 100, "quantity": 10},
+        {"date": "2024-01-01", "region": "North",
+            "product": "B", "sales": 150, "quantity": 5},
+        {"date": "2024-01-01", "region": "South",
+            "product": "A", "sales": 200, "quantity": 8},
+        {"date": "2024-01-02", "region": "North",
+            "product": "A", "sales": 120, "quantity": 12},
+        {"date": "2024-01-02", "region": "South",
+            "product": "B", "sales": 180, "quantity": 6},
+    ]
+
+    def test_dispatches_every_transformation_type(self):
+        parameters = {
+            "aggregate": {"group_by": ["region"]},
+            "filter": {"conditions": {"field": "sales", "operator": "gt", "value": 150}},
+            "normalize": {"columns": ["sales"]},
+            "pivot": {"index": "region", "columns": "product", "values": "sales"},
+        }
 
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        self.sales_data = [
-            {"date": "2024-01-01", "region": "North",
-                "product": "A", "sales": 100, "quantity": 10},
-            {"date": "2024-01-01", "region": "North",
-                "product": "B", "sales": 150, "quantity": 5},
-            {"date": "2024-01-01", "region": "South",
-                "product": "A", "sales": 200, "quantity": 8},
-            {"date": "2024-01-02", "region": "North",
-                "product": "A", "sales": 120, "quantity": 12},
-            {"date": "2024-01-02", "region": "South",
-                "product": "B", "sales": 180, "quantity": 6},
-        ]
+        for transformation_type in self.transformations.TRANSFORMATION_FUNCTIONS:
+            with self.subTest(transformation_type=transformation_type):
+                result = self.transformations.apply_transformation(
+                    self.sales_data, transformation_type,
+                    parameters[transformation_type])
+
+                self.assertIn("data", result)
+                self.assertIn("metadata", result)
 
     def test_complete_data_analysis_workflow(self):
         """Test a complete data analysis workflow."""
         # Step 1: Aggregate by region and product
-        url = reverse("data_transform:transform")
-        data = {
-            "data": self.sales_data,
-            "transformation_type": "aggregate",
-            "parameters": {
+        aggregated = self.transformations.apply_transformation(
+            self.sales_data, "aggregate", {
                 "group_by": ["region", "product"],
                 "aggregations": {"sales": "sum", "quantity": "mean"}
-            }
-        }
+            })
+        aggregated_data = aggregated["data"]
 
-        response = self.client.post(url, data, format="json")
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Step 2: Filter high-performing products
+        filtered = self.transformations.apply_transformation(
+            aggregated_data, "filter", {
+                "conditions": {"field": "sales", "operator": "gte", "value": 200}
+            })
+        filtered_data = filtered["data"]
+
+        self.assertEqual(len(aggregated_data), 4)
+        self.assertEqual(len(filtered_data), 2)
+        self.assertTrue(all(row["sales"] >= 200 for row in filtered_data))
+
+    def test_dataframe_pipeline_matches_record_pipeline(self):
+        steps = [
+            ("filter", {"conditions": {"field": "sales", "operator": "gte", "value": 120}}),
+            ("normalize", {"columns": ["quantity", "score"], "method": "z_score"}),
+            ("pivot", {"index": "region", "columns": "product", "values": "sales"}),
+        ]
+        # "score" is only numeric once the filter drops the "n/a" row
+        data = [
+            {**row, "score": "n/a" if row["sales"] < 120 else row["quantity"] * 2}
+            for row in self.sales_data
+        ]
 
-        aggregated_data = response.data["data"]
+        records = data
+        df = self.transformations.to_dataframe(data)
+        for transformation_type, parameters in steps:
+            result = self.transformations.apply_transformation(
+                records, transformation_type, parameters)
+            records = result["data"]
 
-        # Step 2: Filter high-performing products (use higher threshold to ensure filtering)
-        data = {
-            "data": aggregated_data,
-            "transformation_type": "filter",
-            "parameters": {
-                "conditions": {"field": "sales", "operator": "gte", "value": 200}
-            }
-        }
+            df, metadata = self.transformations.apply_dataframe_transformation(
+                df, transformation_type, parameters)
+            self.assertEqual(metadata, result["metadata"])
 
-        response = self.client.post(url, data, format="json")
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.transformations.from_dataframe(df), records)
+
+
+class IntegrationTest(APITestCase):
+    """Integration tests for complete workflows."""
 
-        filtered_data = response.data["data"]
-        # Should have fewer records after filtering with higher threshold
-        self.assertGreaterEqual(len(aggregated_data), len(filtered_data))
-        # Verify the filtering actually worked
-        self.assertLessEqual(len(filtered_data), len(aggregated_data))
+    sales_data = TransformDispatcherTest.sales_data
 
     def test_error_recovery_workflow(self):
         """Test error handling and recovery in workflows."""
-        url = reverse("data_transform:transform")
+        url = cached_reverse("data_transform:transform")
 
         # First, successful transformation
         data = {
@@ -467,6 +968,6 @@ class IntegrationTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
         # API should still be responsive after error
-        url = reverse("data_transform:health_check")
+        url = cached_reverse("data_transform:health_check")
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -2,8 +2,8 @@
 
 import pandas as pd
 import numpy as np
-from typing import Any, Dict, List, Callable, Union
-from functools import reduce, partial
+from typing import Any, Dict, List, Callable, Tuple, Union
+from functools import reduce, partial, wraps
 import operator
 import logging
 
@@ -28,8 +28,119 @@ def to_dataframe(data: List[Dict[str, Any]]) -> pd.DataFrame:
 
 
 def from_dataframe(df: pd.DataFrame) -> List[Dict[str, Any]]:
-    df_clean = df.where(pd.notnull(df), None)
-    return df_clean.to_dict('records')
+    # Convert column by column (NaN/NaT -> None) and zip the columns into
+    # records, instead of copying the whole frame with where() and then
+    # walking it row by row in to_dict('records')
+    columns = []
+    for position in range(df.shape[1]):
+        series = df.iloc[:, position]
+        values = series.tolist()
+        # numpy int, uint and bool columns cannot hold missing values (the
+        # nullable extension dtypes share their kinds but can)
+        if not (isinstance(series.dtype, np.dtype) and series.dtype.kind in 'iub') and series.hasnans:
+            for index in np.flatnonzero(series.isna().to_numpy()):
+                values[index] = None
+        columns.append(values)
+
+    keys = df.columns.tolist()
+    return [dict(zip(keys, row)) for row in zip(*columns)]
+
+
+# Up to this many records, filtering the dicts directly is cheaper than
+# building a DataFrame and converting the result back to records (the two
+# cost about the same at ~2000 rows)
+PYTHON_FILTER_MAX_ROWS = 1000
+
+ROW_OPERATORS = {
+    'eq': operator.eq,
+    'ne': operator.ne,
+    'gt': operator.gt,
+    'gte': operator.ge,
+    'lt': operator.lt,
+    'lte': operator.le,
+}
+
+# Aggregations the single-key fast path computes exactly as pandas does, by
+# the column dtype kinds each one is taken for. Float sums and means are
+# left to pandas, whose compensated summation a plain reduceat would not
+# reproduce bit for bit; integer sums wrap in int64 exactly like pandas'.
+FAST_AGGREGATION_KINDS = {
+    'sum': 'iu',
+    'mean': 'iu',
+    'count': 'iuf',
+    'min': 'iuf',
+    'max': 'iuf',
+}
+
+# Integer means are summed in float64, which is exact while the absolute
+# sum stays within float64's integer range (kept clear of 2**53 so the
+# float estimate of that bound cannot round across it)
+FAST_MEAN_MAX_ABS_SUM = 2.0 ** 52
+
+# ufuncs whose reduceat gives each fast aggregation over a group ('mean' is
+# the float64 sum divided by the group size, 'count' needs no reduction)
+GROUP_REDUCERS = {'sum': np.add, 'min': np.minimum, 'max': np.maximum}
+
+
+def fast_groupby_agg(df: pd.DataFrame, key: str, agg_dict: Dict[str, str]) -> Union[pd.DataFrame, None]:
+    # Factorize the key once and reduce each column over contiguous groups,
+    # skipping pandas' groupby machinery. Returns None when the inputs need
+    # pandas' NaN/mixed-type handling, so the caller can fall back.
+    key_series = df[key]
+    if key in agg_dict or key_series.hasnans:
+        return None
+
+    for col, func in agg_dict.items():
+        series = df[col]
+        if series.dtype.kind not in FAST_AGGREGATION_KINDS.get(func, '') or series.hasnans:
+            return None
+
+        if func == 'mean' and np.abs(series.to_numpy(dtype=np.float64)).sum() >= FAST_MEAN_MAX_ABS_SUM:
+            return None
+
+    try:
+        codes, uniques = pd.factorize(key_series, sort=True)
+    except TypeError:
+        # Unorderable mixed-type keys
+        return None
+
+    counts = np.bincount(codes)
+    order = np.argsort(codes, kind='stable')
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    result = {key: uniques}
+
+    for col, func in agg_dict.items():
+        if func == 'count':
+            result[col] = counts
+            continue
+
+        if func == 'mean':
+            values = df[col].to_numpy(dtype=np.float64)[order]
+            result[col] = np.add.reduceat(values, starts) / counts
+            continue
+
+        result[col] = GROUP_REDUCERS[func].reduceat(df[col].to_numpy()[order], starts)
+
+    return pd.DataFrame(result)
+
+
+def fast_groupby_count(df: pd.DataFrame, key: str) -> Union[pd.DataFrame, None]:
+    # Group sizes for a single key straight from the factorized codes.
+    # Missing keys get code -1 and are dropped, as groupby() does.
+    if key == 'count':
+        # Leave the column name clash to pandas' error
+        return None
+
+    try:
+        codes, uniques = pd.factorize(df[key], sort=True)
+    except TypeError:
+        # Unorderable mixed-type keys
+        return None
+
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+
+    return pd.DataFrame({key: uniques, 'count': counts})
 
 
 def compose(*functions):
@@ -40,162 +151,320 @@ def pipe(data, *functions):
     return reduce(lambda result, func: func(result), functions, data)
 
 
+AGGREGATION_FUNCTIONS = {
+    'sum': 'sum',
+    'mean': 'mean',
+    'count': 'count',
+    'min': 'min',
+    'max': 'max',
+    'std': 'std'
+}
 
-@safe_transform
-def aggregate_data(data: List[Dict[str, Any]], parameters: Dict[str, Any]) -> Dict[str, Any]:
 
-    df = to_dataframe(data)
+def aggregate_dataframe(df: pd.DataFrame, parameters: Dict[str, Any]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+
     group_by = parameters['group_by']
     aggregations = parameters.get('aggregations', {})
 
     # Functional approach to aggregation
     if not aggregations:
         # Default: count records per group
-        result_df = df.groupby(group_by).size().reset_index(name='count')
-    else:
-        # Apply specific aggregations
-        agg_funcs = {
-            'sum': 'sum',
-            'mean': 'mean',
-            'count': 'count',
-            'min': 'min',
-            'max': 'max',
-            'std': 'std'
-        }
+        result_df = None
+        if isinstance(group_by, list) and len(group_by) == 1:
+            result_df = fast_groupby_count(df, group_by[0])
 
+        if result_df is None:
+            result_df = df.groupby(group_by).size().reset_index(name='count')
+    else:
         # Create aggregation dictionary
         agg_dict = {
-            col: agg_funcs[func] for col, func in aggregations.items()
-            if col in df.columns and func in agg_funcs
+            col: AGGREGATION_FUNCTIONS[func] for col, func in aggregations.items()
+            if col in df.columns and func in AGGREGATION_FUNCTIONS
         }
 
         if not agg_dict:
             raise ValueError("No valid aggregation functions specified")
 
-        result_df = df.groupby(group_by).agg(agg_dict).reset_index()
+        result_df = None
+        if isinstance(group_by, list) and len(group_by) == 1:
+            result_df = fast_groupby_agg(df, group_by[0], agg_dict)
+
+        if result_df is None:
+            result_df = df.groupby(group_by).agg(agg_dict).reset_index()
 
         # Flatten column names if needed
         if isinstance(result_df.columns, pd.MultiIndex):
             result_df.columns = ['_'.join(str(col).strip() for col in cols if col != '')
                                  for cols in result_df.columns.values]
 
-    transformed_data = from_dataframe(result_df)
-
     metadata = {
-        'original_rows': len(data),
-        'transformed_rows': len(transformed_data),
+        'original_rows': len(df),
+        'transformed_rows': len(result_df),
         'group_by_columns': group_by,
         'aggregation_functions': list(aggregations.keys()) if aggregations else ['count']
     }
 
+    return result_df, metadata
+
+
+@safe_transform
+def aggregate_data(data: List[Dict[str, Any]], parameters: Dict[str, Any]) -> Dict[str, Any]:
+
+    result_df, metadata = aggregate_dataframe(to_dataframe(data), parameters)
+
     return {
-        'data': transformed_data,
+        'data': from_dataframe(result_df),
         'metadata': metadata
     }
 
 
-@safe_transform
-def filter_data(data: List[Dict[str, Any]], parameters: Dict[str, Any]) -> Dict[str, Any]:
+def is_missing(value: Any) -> bool:
+    # None or NaN (the only value not equal to itself)
+    return value is None or value != value
 
-    df = to_dataframe(data)
-    conditions = parameters['conditions']
 
-    # Functional approach to filtering
-    def create_condition(condition):
+# Value types the ordering operators compare without raising, as long as a
+# column and the compared value stay within one of these groups
+ORDERABLE_TYPE_GROUPS = (frozenset({int, float, bool}), frozenset({str}))
+
+
+def record_column_types(data: List[Dict[str, Any]]) -> Union[Dict[str, set], None]:
+    # The set of value types in each column, or None when a DataFrame built
+    # from the records would not give every row back unchanged: rows whose
+    # keys differ or come in another order, and columns mixing ints with
+    # floats or missing values, which pandas upcasts to float64
+    keys = list(data[0])
+    if any(list(row) != keys for row in data):
+        return None
+
+    column_types = {}
+    for key in keys:
+        types = set(map(type, map(operator.itemgetter(key), data)))
+        if int in types and (float in types or type(None) in types):
+            return None
+        column_types[key] = types
+
+    return column_types
+
+
+def filter_records(data: List[Dict[str, Any]], conditions: List[Dict[str, Any]]) -> Union[List[Dict[str, Any]], None]:
+    # Evaluates the conditions on the records directly. Returns None whenever
+    # pandas semantics matter (missing values, fields absent from the records,
+    # 'contains', array-valued or mixed-type comparisons, columns pandas
+    # would upcast) so the caller can fall back to the DataFrame path.
+    column_types = record_column_types(data)
+    if column_types is None:
+        return None
+
+    checks = []
+
+    for condition in conditions:
         field = condition['field']
         operator_name = condition['operator']
         value = condition['value']
 
+        if field not in column_types:
+            return None
+
+        if operator_name in ('gt', 'gte', 'lt', 'lte') and not any(
+                column_types[field] | {type(value)} <= group for group in ORDERABLE_TYPE_GROUPS):
+            # pandas raises for these even when an earlier condition already
+            # ruled the row out, which all() below would skip
+            return None
+
+        if operator_name == 'in':
+            values = value if isinstance(value, list) else [value]
+            checks.append((field, lambda cell, vals=values: cell in vals))
+        elif operator_name in ROW_OPERATORS and not isinstance(value, (list, dict)):
+            compare = ROW_OPERATORS[operator_name]
+            checks.append((field, lambda cell, cmp=compare, val=value: cmp(cell, val)))
+        else:
+            return None
+
+    fields = {field for field, _ in checks}
+    if any(is_missing(row[field]) for row in data for field in fields):
+        return None
+
+    return [row for row in data if all(check(row[field]) for field, check in checks)]
+
+
+# Column-wise operators; the comparisons work on Series the same way they
+# work on single values
+COLUMN_OPERATORS = {
+    **ROW_OPERATORS,
+    'contains': lambda col, val: col.astype(str).str.contains(str(val), na=False),
+    'in': lambda col, val: col.isin(val if isinstance(val, list) else [val])
+}
+
+
+def is_numeric_comparison(column: pd.Series, value: Any) -> bool:
+    # Plain numpy numeric column against a number (bool excluded, since
+    # pandas and numpy treat it differently against ints)
+    return (
+        isinstance(column.dtype, np.dtype) and column.dtype.kind in 'iuf'
+        and isinstance(value, (int, float)) and not isinstance(value, bool)
+    )
+
+
+def select_rows(df: pd.DataFrame, conditions: Any) -> pd.DataFrame:
+
+    condition_list = conditions if isinstance(conditions, list) else [conditions]
+    if not condition_list:
+        raise ValueError("No filter conditions specified")
+
+    # AND each condition into a single mask in place rather than keeping one
+    # boolean Series per condition alive until the end
+    mask = np.ones(len(df), dtype=bool)
+    for condition in condition_list:
+        field = condition['field']
+        operator_name = condition['operator']
+
         if field not in df.columns:
             raise ValueError(f"Field '{field}' not found in data")
 
-        # Operator mapping using functional approach
-        operators = {
-            'eq': lambda col, val: col == val,
-            'ne': lambda col, val: col != val,
-            'gt': lambda col, val: col > val,
-            'gte': lambda col, val: col >= val,
-            'lt': lambda col, val: col < val,
-            'lte': lambda col, val: col <= val,
-            'contains': lambda col, val: col.astype(str).str.contains(str(val), na=False),
-            'in': lambda col, val: col.isin(val if isinstance(val, list) else [val])
-        }
-
-        if operator_name not in operators:
+        if operator_name not in COLUMN_OPERATORS:
             raise ValueError(f"Unknown operator: {operator_name}")
 
-        return operators[operator_name](df[field], value)
+        column = df[field]
+        value = condition['value']
 
-    # Apply all conditions using functional composition
-    if isinstance(conditions, list):
-        # Multiple conditions - combine with AND
-        condition_results = list(map(create_condition, conditions))
-        final_condition = reduce(operator.and_, condition_results)
-    else:
-        # Single condition
-        final_condition = create_condition(conditions)
+        if operator_name in ROW_OPERATORS and is_numeric_comparison(column, value):
+            # Compare the raw array; same result, without building a Series
+            matches = ROW_OPERATORS[operator_name](column.to_numpy(), value)
+        else:
+            matches = COLUMN_OPERATORS[operator_name](column, value).to_numpy(dtype=bool)
 
-    filtered_df = df[final_condition]
-    transformed_data = from_dataframe(filtered_df)
+        np.logical_and(mask, matches, out=mask)
 
-    metadata = {
-        'original_rows': len(data),
-        'filtered_rows': len(transformed_data),
+    return df[mask]
+
+
+def filter_metadata(original_rows: int, filtered_rows: int, conditions: Any) -> Dict[str, Any]:
+    return {
+        'original_rows': original_rows,
+        'filtered_rows': filtered_rows,
         'conditions_applied': len(conditions) if isinstance(conditions, list) else 1,
-        'filter_ratio': len(transformed_data) / len(data) if len(data) > 0 else 0
+        'filter_ratio': filtered_rows / original_rows if original_rows > 0 else 0
     }
 
+
+def filter_dataframe(df: pd.DataFrame, parameters: Dict[str, Any]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+
+    conditions = parameters['conditions']
+    result_df = select_rows(df, conditions)
+
+    return result_df, filter_metadata(len(df), len(result_df), conditions)
+
+
+@safe_transform
+def filter_data(data: List[Dict[str, Any]], parameters: Dict[str, Any]) -> Dict[str, Any]:
+
+    conditions = parameters['conditions']
+    condition_list = conditions if isinstance(conditions, list) else [conditions]
+
+    # Small payloads skip the DataFrame round-trip entirely
+    transformed_data = None
+    if data and condition_list and len(data) <= PYTHON_FILTER_MAX_ROWS:
+        transformed_data = filter_records(data, condition_list)
+
+    if transformed_data is None:
+        transformed_data = from_dataframe(select_rows(to_dataframe(data), conditions))
+
     return {
         'data': transformed_data,
-        'metadata': metadata
+        'metadata': filter_metadata(len(data), len(transformed_data), conditions)
     }
 
 
-@safe_transform
-def normalize_data(data: List[Dict[str, Any]], parameters: Dict[str, Any]) -> Dict[str, Any]:
+# The helpers below skip NaN like pandas does, but leave NaN (rather than
+# a numpy RuntimeWarning) for columns with too few values. Silencing those
+# warnings would need warnings.catch_warnings(), which swaps process-wide
+# state and is not thread-safe; np.errstate covers the arithmetic and is.
+
+def column_mean_std(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # NaN-skipping column means and sample (ddof=1) standard deviations
+    valid = ~np.isnan(matrix)
+    counts = valid.sum(axis=0)
+
+    with np.errstate(all='ignore'):
+        means = np.where(valid, matrix, 0.0).sum(axis=0) / counts
+        squares = np.where(valid, matrix - means, 0.0) ** 2
+        stds = np.sqrt(squares.sum(axis=0) / (counts - 1))
+
+    return means, np.where(counts > 1, stds, np.nan)
+
+
+def robust_scale(matrix: np.ndarray) -> np.ndarray:
+    # Center on the median and scale by the interquartile range, with all
+    # three quantiles taken in a single pass over each column. All-NaN
+    # columns are left out of the quantile call, which warns on them.
+    has_values = ~np.isnan(matrix).all(axis=0)
+    quantiles = np.full((3, matrix.shape[1]), np.nan)
+    quantiles[:, has_values] = np.nanquantile(
+        matrix[:, has_values], [0.25, 0.5, 0.75], axis=0)
+
+    q25, median, q75 = quantiles
+    return (matrix - median) / (q75 - q25)
+
+
+def min_max_scale(matrix: np.ndarray) -> np.ndarray:
+    # fmin/fmax skip NaN, and give NaN for all-NaN columns without warning
+    mins = np.fmin.reduce(matrix, axis=0)
+    return (matrix - mins) / (np.fmax.reduce(matrix, axis=0) - mins)
+
+
+# Each normalizer works on the whole (rows, columns) matrix at once and
+# receives the NaN-skipping column means/stds, which are needed for the
+# metadata anyway
+NORMALIZERS = {
+    'min_max': lambda matrix, means, stds: min_max_scale(matrix),
+    'z_score': lambda matrix, means, stds: (matrix - means) / stds,
+    'robust': lambda matrix, means, stds: robust_scale(matrix)
+}
+
+
+def normalize_dataframe(df: pd.DataFrame, parameters: Dict[str, Any]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
 
-    df = to_dataframe(data)
     columns = parameters['columns']
     method = parameters.get('method', 'min_max')
 
     numeric_columns = df.select_dtypes(include=[np.number]).columns.tolist()
-    valid_columns = [col for col in columns if col in numeric_columns]
+    valid_columns = list(dict.fromkeys(col for col in columns if col in numeric_columns))
 
     if not valid_columns:
         raise ValueError("No valid numeric columns found for normalization")
 
-    normalizers = {
-        'min_max': lambda series: (series - series.min()) / (series.max() - series.min()),
-        'z_score': lambda series: (series - series.mean()) / series.std(),
-        'robust': lambda series: (series - series.median()) / series.quantile(0.75) - series.quantile(0.25)
-    }
-
-    if method not in normalizers:
+    if method not in NORMALIZERS:
         raise ValueError(f"Unknown normalization method: {method}")
 
-    normalizer = normalizers[method]
+    normalizer = NORMALIZERS[method]
 
-    result_df = df.copy()
-    normalization_stats = {}
+    matrix = df[valid_columns].to_numpy(dtype=np.float64)
 
-    for col in valid_columns:
-        original_series = result_df[col]
-        normalized_series = normalizer(original_series)
+    means, stds = column_mean_std(matrix)
 
-        normalized_series = normalized_series.replace(
-            [np.inf, -np.inf], np.nan)
-        normalized_series = normalized_series.fillna(0)
+    # All-NaN columns, single rows and zero ranges are handled by mapping
+    # the resulting NaN/inf to 0
+    with np.errstate(all='ignore'):
+        normalized = np.nan_to_num(
+            normalizer(matrix, means, stds), nan=0.0, posinf=0.0, neginf=0.0)
 
-        result_df[col] = normalized_series
+    normalized_means, normalized_stds = column_mean_std(normalized)
 
-        normalization_stats[col] = {
-            'original_mean': float(original_series.mean()),
-            'original_std': float(original_series.std()),
-            'normalized_mean': float(normalized_series.mean()),
-            'normalized_std': float(normalized_series.std())
-        }
+    # Only the normalized columns are replaced, so a shallow copy is enough
+    # to leave the input frame untouched without duplicating the others
+    result_df = df.copy(deep=False)
+    result_df[valid_columns] = normalized
 
-    transformed_data = from_dataframe(result_df)
+    normalization_stats = {
+        col: {
+            'original_mean': float(means[i]),
+            'original_std': float(stds[i]),
+            'normalized_mean': float(normalized_means[i]),
+            'normalized_std': float(normalized_stds[i])
+        }
+        for i, col in enumerate(valid_columns)
+    }
 
     metadata = {
         'normalized_columns': valid_columns,
@@ -203,16 +472,31 @@ def normalize_data(data: List[Dict[str, Any]], parameters: Dict[str, Any]) -> Di
         'statistics': normalization_stats
     }
 
+    return result_df, metadata
+
+
+@safe_transform
+def normalize_data(data: List[Dict[str, Any]], parameters: Dict[str, Any]) -> Dict[str, Any]:
+
+    result_df, metadata = normalize_dataframe(to_dataframe(data), parameters)
+
     return {
-        'data': transformed_data,
+        'data': from_dataframe(result_df),
         'metadata': metadata
     }
 
 
-@safe_transform
-def pivot_data(data: List[Dict[str, Any]], parameters: Dict[str, Any]) -> Dict[str, Any]:
+PIVOT_AGGREGATIONS = {
+    'sum': 'sum',
+    'mean': 'mean',
+    'count': 'count',
+    'min': 'min',
+    'max': 'max'
+}
+
+
+def pivot_dataframe(df: pd.DataFrame, parameters: Dict[str, Any]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
 
-    df = to_dataframe(data)
     index_col = parameters['index']
     columns_col = parameters['columns']
     values_col = parameters['values']
@@ -224,22 +508,14 @@ def pivot_data(data: List[Dict[str, Any]], parameters: Dict[str, Any]) -> Dict[s
     if missing_cols:
         raise ValueError(f"Missing required columns: {missing_cols}")
 
-    agg_functions = {
-        'sum': 'sum',
-        'mean': 'mean',
-        'count': 'count',
-        'min': 'min',
-        'max': 'max'
-    }
-
-    if aggfunc not in agg_functions:
+    if aggfunc not in PIVOT_AGGREGATIONS:
         raise ValueError(f"Unknown aggregation function: {aggfunc}")
 
     pivot_df = df.pivot_table(
         index=index_col,
         columns=columns_col,
         values=values_col,
-        aggfunc=agg_functions[aggfunc],
+        aggfunc=PIVOT_AGGREGATIONS[aggfunc],
         fill_value=0
     )
 
@@ -251,19 +527,25 @@ def pivot_data(data: List[Dict[str, Any]], parameters: Dict[str, Any]) -> Dict[s
     else:
         pivot_df.columns = [str(col) for col in pivot_df.columns]
 
-    transformed_data = from_dataframe(pivot_df)
-
     metadata = {
-        'original_rows': len(data),
-        'pivoted_rows': len(transformed_data),
+        'original_rows': len(df),
+        'pivoted_rows': len(pivot_df),
         'index_column': index_col,
         'pivot_columns': columns_col,
         'values_column': values_col,
         'aggregation_function': aggfunc
     }
 
+    return pivot_df, metadata
+
+
+@safe_transform
+def pivot_data(data: List[Dict[str, Any]], parameters: Dict[str, Any]) -> Dict[str, Any]:
+
+    result_df, metadata = pivot_dataframe(to_dataframe(data), parameters)
+
     return {
-        'data': transformed_data,
+        'data': from_dataframe(result_df),
         'metadata': metadata
     }
 
@@ -290,3 +572,39 @@ def apply_transformation(
     parametrized_transform = partial(transform_func, parameters=parameters)
 
     return parametrized_transform(data)
+
+
+def pipeline_step(func: Callable) -> Callable:
+    # An earlier step can leave no rows; reject that here, inside the
+    # safe_transform wrapping, as to_dataframe does for record input.
+    # Results are re-inferred so a column that only held mixed values in
+    # the dropped rows gets the dtype to_dataframe would give it
+    @wraps(func)
+    def step(df: pd.DataFrame, parameters: Dict[str, Any]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        if len(df) == 0:
+            raise ValueError("Data cannot be empty")
+        result_df, metadata = func(df, parameters)
+        return result_df.infer_objects(), metadata
+    return safe_transform(step)
+
+
+# DataFrame-level transformations, so multi-step pipelines can hand one
+# frame from step to step and convert to records only once at the end
+DATAFRAME_TRANSFORMATIONS = {
+    'aggregate': pipeline_step(aggregate_dataframe),
+    'filter': pipeline_step(filter_dataframe),
+    'normalize': pipeline_step(normalize_dataframe),
+    'pivot': pipeline_step(pivot_dataframe)
+}
+
+
+def apply_dataframe_transformation(
+    df: pd.DataFrame,
+    transformation_type: str,
+    parameters: Dict[str, Any]
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+
+    if transformation_type not in DATAFRAME_TRANSFORMATIONS:
+        raise ValueError(f"Unknown transformation type: {transformation_type}")
+
+    return DATAFRAME_TRANSFORMATIONS[transformation_type](df, parameters)
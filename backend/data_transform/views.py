@@ -1,9 +1,13 @@
 import time
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List
 
+import pandas as pd
+from django.http import HttpResponseBase, StreamingHttpResponse
+from drf_orjson_renderer.renderers import ORJSONRenderer
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import APIException
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -12,11 +16,20 @@ from drf_spectacular.utils import extend_schema, OpenApiExample
 from .serializers import (
     DataTransformationInputSerializer,
     DataTransformationOutputSerializer,
+    get_input_serializer_class,
+)
+from .transformations import (
+    apply_dataframe_transformation,
+    apply_transformation,
+    from_dataframe,
+    to_dataframe,
 )
-from .transformations import apply_transformation
 
 logger = logging.getLogger(__name__)
 
+# Rows converted and encoded per chunk when streaming a batch result
+STREAM_CHUNK_ROWS = 1000
+
 
 class DataTransformationView(APIView):
 
@@ -94,7 +107,12 @@ class DataTransformationView(APIView):
 
         try:
 
-            serializer = DataTransformationInputSerializer(data=request.data)
+            payload = request.data
+            serializer_class = get_input_serializer_class(
+                payload.get('transformation_type')
+                if isinstance(payload, dict) else None
+            )
+            serializer = serializer_class(data=payload)
             if not serializer.is_valid():
                 logger.warning(f"Invalid input data: {serializer.errors}")
                 return Response(
@@ -158,6 +176,10 @@ class DataTransformationView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        except APIException:
+            # Malformed or oversized request bodies keep their own status
+            raise
+
         except Exception as e:
 
             processing_time = (time.time() - start_time) * 1000
@@ -259,9 +281,34 @@ def transformation_types(request) -> Response:
     )
 
 
+def iter_batch_response(
+    df: pd.DataFrame,
+    message: str,
+    transformation_steps: List[Dict[str, Any]],
+    processing_time_ms: float
+) -> Iterator[bytes]:
+    # Encodes the same body a Response would, but turns the final frame
+    # into records one chunk at a time so the full list of row dicts and
+    # its encoded copy never have to be held at once
+    renderer = ORJSONRenderer()
+
+    yield b'{"success":true,"message":' + renderer.render(message) + b',"data":['
+
+    separator = b''
+    for start in range(0, len(df), STREAM_CHUNK_ROWS):
+        rows = from_dataframe(df.iloc[start:start + STREAM_CHUNK_ROWS])
+        yield separator + renderer.render(rows)[1:-1]
+        separator = b','
+
+    yield (
+        b'],"transformation_steps":' + renderer.render(transformation_steps)
+        + b',"processing_time_ms":' + renderer.render(processing_time_ms) + b'}'
+    )
+
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
-def batch_transform(request) -> Response:
+def batch_transform(request) -> HttpResponseBase:
 
     start_time = time.time()
 
@@ -289,7 +336,9 @@ def batch_transform(request) -> Response:
             )
 
 
-        current_data = data
+        # The frame is handed from step to step and only turned back into
+        # records once every step has run
+        current_df = None
         transformation_results = []
 
         for i, transform_config in enumerate(transformations):
@@ -303,16 +352,17 @@ def batch_transform(request) -> Response:
                 )
 
             try:
-                result = apply_transformation(
-                    current_data, transformation_type, parameters)
+                if current_df is None:
+                    current_df = to_dataframe(data)
 
-                current_data = result['data']
+                current_df, metadata = apply_dataframe_transformation(
+                    current_df, transformation_type, parameters)
 
                 transformation_results.append({
                     'step': i + 1,
                     'transformation_type': transformation_type,
                     'parameters': parameters,
-                    'metadata': result['metadata']
+                    'metadata': metadata
                 })
 
             except Exception as e:
@@ -327,17 +377,20 @@ def batch_transform(request) -> Response:
 
         processing_time = (time.time() - start_time) * 1000
 
-        return Response(
-            {
-                'success': True,
-                'message': f'Successfully applied {len(transformations)} transformations',
-                'data': current_data,
-                'transformation_steps': transformation_results,
-                'processing_time_ms': round(processing_time, 2)
-            },
+        return StreamingHttpResponse(
+            iter_batch_response(
+                current_df,
+                f'Successfully applied {len(transformations)} transformations',
+                transformation_results,
+                round(processing_time, 2)
+            ),
+            content_type='application/json',
             status=status.HTTP_200_OK
         )
 
+    except APIException:
+        raise
+
     except Exception as e:
         processing_time = (time.time() - start_time) * 1000
         logger.error(f"Batch transformation error: {str(e)}", exc_info=True)